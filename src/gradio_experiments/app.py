@@ -1,4 +1,6 @@
 import base64
+import functools
+import inspect
 import io
 import os
 import signal
@@ -7,6 +9,7 @@ import sys
 import platform
 import PIL
 import PIL.Image
+import PIL.ImageOps
 import gradio as gr
 
 # See why we are doing this with the local package: https://discuss.huggingface.co/t/custom-python-packages-at-spaces/17250/6
@@ -41,6 +44,8 @@ except ImportError:
     )
 
 import polars as pl
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 
 
 class GradioApp:
@@ -50,16 +55,196 @@ class GradioApp:
         "uninitialised, click 'Change browser state' to initialise"
     )
 
+    THEME = gr.themes.Ocean(
+        radius_size="md",
+        font=gr.themes.GoogleFont("Lato", weights=(100, 300)),
+        font_mono=gr.themes.GoogleFont("IBM Plex Mono", weights=(100, 300)),
+    )
+
+    HEADER_MD = inspect.cleandoc(
+        f"""
+        # gradio-experiments
+
+        A collection of feature experiments with Gradio.
+
+         - Gradio version: _{gr.get_package_version()}_
+         - Python version: _{sys.version}_
+         - Platform: _{platform.uname()._asdict()}_
+         - GitHub repository: _[gradio-experiments](https://github.com/anirbanbasu/gradio-experiments)_
+        """
+    )
+    STATE_MANAGEMENT_EXPLANATION_MD = inspect.cleandoc(
+        """
+        This component demonstrates the management of global state, session state (using `gr.State`) and browser state (using `gr.BrowserState`).
+
+        ## Expected behaviour
+
+        - **Global state**: The global state is shared across all web sessions. Modifications to the global state are reflected in all sessions.
+        - **Session state**: The session state is specific to the user's browser session. The session state is not shared across different browser sessions and lost when the browser window is closed or the page is refreshed.
+        - **Browser state**: The browser state is stored in the browser's local storage. It is not shared across different browsers but shared across multiple windows of the same browser. The browser state persists even when the browser window is closed or the page is refreshed.
+
+        **Note**: If you want the browser state to be cleared, you must clear the key named `{state_key}` from the browser's local storage.
+
+        ## Try it out
+        1. Open this page in two different browsers, not just browser tabs.
+        2. Change the global state in one browser (by clicking the 'Change global state' button) and see the changes reflected in the other browser (by clicking the 'Refresh states' button).
+        3. Change the session state in one browser (by clicking the 'Change session state' button) and see that the changes are **not** reflected in the other browser (by clicking the 'Refresh states' button). It **will be lost** if the browser window is closed or the page is refreshed.
+        4. Change the browser state in one browser (by clicking the 'Change browser state' button) and see that the changes are **not** reflected in the other browser (by clicking the 'Refresh states' button). Close one browser and re-open it, click the 'Refresh states' button to see that the browser state has been persisted.
+
+        Notice that the 'Task output' is the result of a task performed by an object, which is maintained as a reference in the global and session and browser states. Thus, the task output is shared across all sessions even whether it is triggered by a global state change or a session state change or a browser state change.
+        """
+    )
+    DATASETS_EXPLANATION_MD = inspect.cleandoc(
+        """
+        This component experiments with datasets. _More explanation will be added._
+        """
+    )
+    PYDANTIC_PROFILES_EXPLANATION_MD = inspect.cleandoc(
+        """
+        This component experiments with profile information backed by Pydantic models. _More explanation will be added._
+        """
+    )
+    JSON_FORMATTING_EXPLANATION_MD = inspect.cleandoc(
+        """
+        This component experiments with JSON formatting.
+
+        As of version 5.38.0, Gradio's JSON component is unable to correctly display a pretty-printed JSON string. Instead of displaying
+        the JSON string as a formatted dictionary or list, it displays it as a single line of text. For example, a JSON string will be displayed
+        as follows:
+        ```json
+        "{ "text": "Hello", "number": 221, "my_object": { "name": "Sherlock", "time": 1752809241.129743 } }"
+        ```
+        instead of:
+        ```json
+        {
+            "text": "Hello",
+            "number": 221,
+            "my_object": {
+                "name": "Sherlock",
+                "time": 1752809241.129743
+            }
+        }
+        ```
+
+        The [pull request 11608](https://github.com/gradio-app/gradio/pull/11608) accepted in Gradio version 5.38.1 fixes this issue.
+        """
+    )
+
+    TEXT_EXAMPLES = [
+        ["Hello, World!"],
+        ["This is a test."],
+        ["This is a slightly longer sentence: how does the weather seem like today?"],
+    ]
+    TEXT_EXAMPLE_LABELS = [
+        "The usual hello world.",
+        "A test sentence.",
+        "A longer sentence.",
+    ]
+
+    PROFILE_IMAGE_MAX_SIZE = (512, 512)
+
+    DATASET_READERS = {
+        AppConstants.FILE_EXTENSION_CSV: functools.partial(
+            pl.scan_csv, ignore_errors=True
+        ),
+        AppConstants.FILE_EXTENSION_JSON: lambda source: pl.read_json(source).lazy(),
+        AppConstants.FILE_EXTENSION_PARQUET: pl.scan_parquet,
+    }
+
     def __init__(self):
         # This is a safe global variable because it remains the same for all users and is never modified.
         self.app_name = "gradio-experiments"
         self.state_key = f"{self.app_name}-local-state"
         self.profile_key = f"{self.app_name}-entity-profile"
+        self.state_management_explanation_md = (
+            GradioApp.STATE_MANAGEMENT_EXPLANATION_MD.format(state_key=self.state_key)
+        )
 
         self.global_state = StateData()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def task_output_dictionary(
+        global_task_output: str,
+        session_task_output: str,
+        browser_task_output: str,
+    ) -> dict:
+        """
+        Build the task output dictionary shown by the state management component. The dictionary
+        is cached for each combination of task outputs, so it must not be modified by the caller.
+
+        Args:
+            global_task_output (str): The task output of the global state.
+            session_task_output (str): The task output of the session state.
+            browser_task_output (str): The task output of the browser state.
+
+        Returns:
+            dict: The task output of each state, keyed by the name of the state.
+        """
+        return {
+            "global": global_task_output,
+            "session": session_task_output,
+            "browser": browser_task_output,
+        }
+
+    @staticmethod
+    def sniff_dataset_file_format(file_path: str, extension: str) -> str:
+        """
+        Detect the format of a dataset file. Parquet files are recognised from their first bytes,
+        the format of any other file is given by its extension.
+
+        Args:
+            file_path (str): The path of the dataset file.
+            extension (str): The lower case extension of the dataset file.
+
+        Returns:
+            str: The file extension of the detected format.
+        """
+        with open(file_path, "rb") as file:
+            head = file.read(4)
+        if head == b"PAR1":
+            return AppConstants.FILE_EXTENSION_PARQUET
+        return extension
+
+    @staticmethod
+    def open_uploaded_image(image_data: bytes) -> PIL.Image.Image:
+        """
+        Open an uploaded image, upright according to its EXIF orientation. JPEG images are
+        decoded at a reduced scale close to the maximum size of the profile images.
+
+        Args:
+            image_data (bytes): The data of the uploaded image file.
+
+        Returns:
+            PIL.Image.Image: The loaded image.
+        """
+        image = PIL.Image.open(io.BytesIO(image_data))
+        image.draft("RGB", GradioApp.PROFILE_IMAGE_MAX_SIZE)
+        image.load()
+        PIL.ImageOps.exif_transpose(image, in_place=True)
+        return image
+
+    @staticmethod
+    def encode_profile_image(image_data: bytes) -> str:
+        """
+        Downsize an uploaded image to the maximum size of the profile images and encode it for storage.
+
+        Args:
+            image_data (bytes): The data of the uploaded image file.
+
+        Returns:
+            str: The base64 encoded WEBP data of the image.
+        """
+        image = GradioApp.open_uploaded_image(image_data)
+        image.thumbnail(GradioApp.PROFILE_IMAGE_MAX_SIZE, PIL.Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format="WEBP", quality=85, method=4)
+        return base64.b64encode(buffer.getvalue()).decode("ascii")
+
     def component_text_transformation(self) -> gr.Group:
         """This is a placeholder component for text transformation."""
+        uppercase = functools.lru_cache(maxsize=256)(str.upper)
+
         with gr.Group() as component:
             with gr.Row(equal_height=True):
                 with gr.Column():
@@ -70,17 +255,10 @@ class GradioApp:
                     )
                     gr.Examples(
                         label="Choose an example or type your own input text above.",
-                        examples=[
-                            "Hello, World!",
-                            "This is a test.",
-                            "This is a slightly longer sentence: how does the weather seem like today?",
-                        ],
-                        example_labels=[
-                            "The usual hello world.",
-                            "A test sentence.",
-                            "A longer sentence.",
-                        ],
+                        examples=GradioApp.TEXT_EXAMPLES,
+                        example_labels=GradioApp.TEXT_EXAMPLE_LABELS,
                         inputs=[input_text],
+                        cache_examples=False,
                     )
                 output_text = gr.Textbox(
                     lines=8,
@@ -93,9 +271,11 @@ class GradioApp:
                 outputs=[output_text],
                 trigger_mode="always_last",
                 api_name="text_transform_to_uppercase",
+                batch=True,
+                max_batch_size=16,
             )
-            def text_to_uppercase(text: str) -> str:
-                return text.upper()
+            async def text_to_uppercase(texts: list[str]) -> list[list[str]]:
+                return [[uppercase(text) for text in texts]]
 
         return component
 
@@ -104,17 +284,53 @@ class GradioApp:
 
         def state_task_dictionary(
             session_state_value: StateData,
-            browser_state_value: StateData,
+            browser_state_initialised: bool,
         ) -> dict:
-            return {
-                "global": self.global_state.an_object.task_output,
-                "session": session_state_value.an_object.task_output,
-                "browser": (
-                    browser_state_value.an_object.task_output
-                    if browser_state_value
+            return GradioApp.task_output_dictionary(
+                self.global_state.an_object.task_output,
+                session_state_value.an_object.task_output,
+                (
+                    self.global_state.an_object.task_output
+                    if browser_state_initialised
                     else GradioApp.BROWSER_STATE_UNINITIALISED_MSG
                 ),
-            }
+            )
+
+        @functools.lru_cache(maxsize=32)
+        def decode_browser_state(browser_state_value: str | None) -> StateData | None:
+            if not browser_state_value:
+                return None
+            browser_state_obj = StateData(an_object=self.global_state.an_object)
+            browser_state_obj.reset_from_json_str(browser_state_value)
+            return browser_state_obj
+
+        def state_refresh_key(
+            session_state_value: StateData, browser_state_value: str | None
+        ) -> tuple:
+            # The sources of each display, including the task outputs shared across sessions
+            return (
+                self.global_state.version,
+                session_state_value.version,
+                browser_state_value,
+                (
+                    self.global_state.an_object.task_output,
+                    session_state_value.an_object.task_output,
+                    bool(browser_state_value),
+                ),
+            )
+
+        def merge_refresh_key(
+            refresh_key_value: tuple | None,
+            current_refresh_key: tuple,
+            displayed: tuple[bool, ...],
+        ) -> tuple:
+            last_refresh_key = refresh_key_value or (None,) * len(current_refresh_key)
+            return tuple(
+                current if is_displayed else last
+                for current, last, is_displayed in zip(
+                    current_refresh_key, last_refresh_key, displayed
+                )
+            )
 
         with gr.Group() as component:
             session_state = gr.State(
@@ -125,21 +341,26 @@ class GradioApp:
                 storage_key=self.state_key,
                 secret=EnvironmentVariables.LOCAL_STORAGE_ENCRYPTION_KEY,
             )
+            # The refresh key of the states last rendered in this session
+            refresh_key = gr.State(None)
             with gr.Row(equal_height=True):
-                json_global_state = gr.JSON(
-                    value=self.global_state.__dict__,
+                json_global_state = gr.Code(
+                    value=self.global_state.to_json(),
+                    language="json",
                     label="Global state",
-                    max_height=300,
+                    max_lines=12,
                 )
-                json_session_state = gr.JSON(
-                    value=session_state.value.__dict__,
+                json_session_state = gr.Code(
+                    value=session_state.value.to_json(),
+                    language="json",
                     label="Session state",
-                    max_height=300,
+                    max_lines=12,
                 )
-                json_browser_state = gr.JSON(
+                json_browser_state = gr.Code(
                     value=None,
+                    language="json",
                     label="Browser state",
-                    max_height=300,
+                    max_lines=12,
                 )
             json_task_output = gr.JSON(
                 value=None,
@@ -165,22 +386,27 @@ class GradioApp:
                 )
 
         @btn_change_global_state.click(
-            inputs=[session_state, browser_state],
-            outputs=[json_global_state, json_task_output],
+            inputs=[session_state, browser_state, refresh_key],
+            outputs=[json_global_state, json_task_output, refresh_key],
             api_name="state_management_change_global_state",
+            show_progress="hidden",
         )
-        def change_global_state(
-            session_state_value: StateData, browser_state_value: str
+        async def change_global_state(
+            session_state_value: StateData,
+            browser_state_value: str,
+            refresh_key_value: tuple | None,
         ):
             self.global_state.make_random_changes("global")
-            browser_state_obj = StateData(an_object=self.global_state.an_object)
-            if browser_state_value is not None:
-                browser_state_obj.reset_from_json_str(browser_state_value)
             return (
-                self.global_state.__dict__,
+                self.global_state.to_json(),
                 state_task_dictionary(
                     session_state_value,
-                    browser_state_obj if browser_state_value else None,
+                    bool(browser_state_value),
+                ),
+                merge_refresh_key(
+                    refresh_key_value,
+                    state_refresh_key(session_state_value, browser_state_value),
+                    (True, False, False, True),
                 ),
             )
 
@@ -188,37 +414,46 @@ class GradioApp:
             inputs=[session_state],
             outputs=[session_state],
             api_name="state_management_change_session_state",
+            show_progress="hidden",
         )
-        def change_session_state(session_state_value: StateData):
+        async def change_session_state(session_state_value: StateData):
             session_state_value.make_random_changes("session")
             return gr.update(value=session_state_value)
 
         @session_state.change(
-            inputs=[session_state, browser_state],
-            outputs=[json_session_state, json_task_output],
+            inputs=[session_state, browser_state, refresh_key],
+            outputs=[json_session_state, json_task_output, refresh_key],
             api_name=False,
+            show_progress="hidden",
         )
-        def session_state_change_event(
-            session_state_value: StateData, browser_state_value: str
+        async def session_state_change_event(
+            session_state_value: StateData,
+            browser_state_value: str,
+            refresh_key_value: tuple | None,
         ):
-            browser_state_obj = StateData(an_object=self.global_state.an_object)
-            if browser_state_value is not None:
-                browser_state_obj.reset_from_json_str(browser_state_value)
             return (
-                session_state_value.__dict__,
+                session_state_value.to_json(),
                 state_task_dictionary(
                     session_state_value,
-                    browser_state_obj if browser_state_value else None,
+                    bool(browser_state_value),
+                ),
+                merge_refresh_key(
+                    refresh_key_value,
+                    state_refresh_key(session_state_value, browser_state_value),
+                    (False, True, False, True),
                 ),
             )
 
         @btn_change_browser_state.click(
-            inputs=[session_state, browser_state],
-            outputs=[browser_state, json_browser_state, json_task_output],
+            inputs=[session_state, browser_state, refresh_key],
+            outputs=[browser_state, json_browser_state, json_task_output, refresh_key],
             api_name="state_management_change_browser_state",
+            show_progress="hidden",
         )
-        def change_browser_state(
-            session_state_value: StateData, browser_state_value: str
+        async def change_browser_state(
+            session_state_value: StateData,
+            browser_state_value: str,
+            refresh_key_value: tuple | None,
         ):
             browser_state_obj = StateData(an_object=self.global_state.an_object)
             if browser_state_value is not None:
@@ -226,36 +461,76 @@ class GradioApp:
             browser_state_obj.make_random_changes("browser")
             return (
                 gr.update(value=browser_state_obj),
-                browser_state_obj.__dict__,
+                browser_state_obj.to_json(),
                 state_task_dictionary(
                     session_state_value,
-                    browser_state_obj,
+                    True,
+                ),
+                # The browser sends back the string representation of the state
+                merge_refresh_key(
+                    refresh_key_value,
+                    state_refresh_key(session_state_value, str(browser_state_obj)),
+                    (False, False, True, True),
                 ),
             )
 
         @gr.on(
             triggers=[btn_refresh_states.click, self.interface.load],
-            inputs=[session_state, browser_state],
+            inputs=[session_state, browser_state, refresh_key],
             outputs=[
                 json_global_state,
                 json_session_state,
                 json_browser_state,
                 json_task_output,
+                refresh_key,
             ],
             api_name="state_management_refresh",
+            show_progress="hidden",
+            trigger_mode="always_last",
         )
-        def refresh_states(session_state_value: StateData, browser_state_value: str):
-            browser_state_obj = StateData(an_object=self.global_state.an_object)
-            if browser_state_value is not None:
-                browser_state_obj.reset_from_json_str(browser_state_value)
+        async def refresh_states(
+            session_state_value: StateData,
+            browser_state_value: str,
+            refresh_key_value: tuple | None,
+            event: gr.EventData,
+        ):
+            current_refresh_key = state_refresh_key(
+                session_state_value, browser_state_value
+            )
+            if event.target is None:
+                # API calls and page loads have no trigger, both always get every state
+                changed = (True,) * 4
+            else:
+                last_refresh_key = refresh_key_value or (None,) * len(
+                    current_refresh_key
+                )
+                if current_refresh_key == last_refresh_key:
+                    return (gr.skip(),) * 5
+                changed = tuple(
+                    current != last
+                    for current, last in zip(current_refresh_key, last_refresh_key)
+                )
+            global_changed, session_changed, browser_changed, task_changed = changed
+            browser_state_obj = (
+                decode_browser_state(browser_state_value) if browser_changed else None
+            )
             return (
-                self.global_state.__dict__,
-                session_state_value.__dict__,
-                (browser_state_obj.__dict__ if browser_state_value else None),
-                state_task_dictionary(
-                    session_state_value,
-                    browser_state_obj if browser_state_value else None,
+                self.global_state.to_json() if global_changed else gr.skip(),
+                session_state_value.to_json() if session_changed else gr.skip(),
+                (
+                    (browser_state_obj.to_json() if browser_state_obj else None)
+                    if browser_changed
+                    else gr.skip()
+                ),
+                (
+                    state_task_dictionary(
+                        session_state_value,
+                        bool(browser_state_value),
+                    )
+                    if task_changed
+                    else gr.skip()
                 ),
+                current_refresh_key,
             )
 
         return component
@@ -263,8 +538,8 @@ class GradioApp:
     def component_datasets(self) -> gr.Group:
         """This is a component to experiment with datasets."""
         with gr.Group() as component:
+            # The dataset with its row and column counts, which are computed once per upload
             session_pl_dataframe = gr.State(None)
-            session_pl_dataframe_display = gr.State(None)
             file_dataset = gr.File(
                 label="Dataset file",
                 visible=True,
@@ -285,58 +560,51 @@ class GradioApp:
                 label="Last selected row", value=None, max_height=300, visible=False
             )
 
+        # Synchronous, so that Gradio runs the file reading in a worker thread
         @file_dataset.upload(
             inputs=[file_dataset],
             outputs=[session_pl_dataframe],
             api_name="dataset_upload",
+            concurrency_limit=2,
+            concurrency_id="dataset_io",
         )
         def upload_dataset_file(file):
             if file is None:
                 return None
             _, extension = os.path.splitext(file.name)
-            if extension.lower() == AppConstants.FILE_EXTENSION_CSV:
-                result = pl.read_csv(
-                    source=file.name,
-                    ignore_errors=True,
-                    use_pyarrow=True,
-                    batch_size=16384,
-                )
-            elif extension.lower() == AppConstants.FILE_EXTENSION_JSON:
-                result = pl.read_json(source=file.name)
-            elif extension.lower() == AppConstants.FILE_EXTENSION_PARQUET:
-                result = pl.read_parquet(source=file.name)
-            else:
+            extension = extension.lower()
+            if extension not in AppConstants.ALLOWED_DATASET_FILE_EXTENSIONS:
                 raise gr.Error(
                     f"Unsupported dataset file extension: '{extension}'. Supported extensions: {AppConstants.ALLOWED_DATASET_FILE_EXTENSIONS}."
                 )
+            result = GradioApp.DATASET_READERS[
+                GradioApp.sniff_dataset_file_format(file.name, extension)
+            ](file.name)
+            row_count = result.select(pl.len()).collect().item()
+            column_count = result.collect_schema().len()
             gr.Info(
-                message=f"Loaded data frame: {result.shape[0]} rows and {result.shape[1]} columns.",
+                message=f"Loaded data frame: {row_count} rows and {column_count} columns.",
                 duration=5,
             )
-            return result
+            return result, row_count, column_count
 
         @file_dataset.clear(
             outputs=[session_pl_dataframe],
             api_name="dataset_clear",
         )
-        def clear_dataset_file():
+        async def clear_dataset_file():
             return None
 
         @session_pl_dataframe.change(
             inputs=[session_pl_dataframe],
-            outputs=[session_pl_dataframe_display],
-            api_name=False,
-        )
-        def session_pl_dataframe_changed(data: pl.DataFrame):
-            return data
-
-        @session_pl_dataframe_display.change(
-            inputs=[session_pl_dataframe_display],
             outputs=[dataframe_data_preview, json_selected_row],
             api_name=False,
         )
-        def session_pl_dataframe_display_changed(data: pl.DataFrame):
-            if data is None or data.shape[0] == 0:
+        def session_pl_dataframe_changed(
+            dataset: tuple[pl.LazyFrame, int, int] | None,
+        ):
+            data, row_count, column_count = dataset or (None, 0, 0)
+            if row_count == 0:
                 return (
                     gr.update(value=None, visible=False),
                     gr.update(value=None, visible=False),
@@ -344,28 +612,27 @@ class GradioApp:
 
             return (
                 gr.update(
-                    label=f"Rows {data.shape[0]}, columns {data.shape[1]}.",
-                    value=data,
+                    label=f"Rows {row_count} (showing {min(row_count, AppConstants.PREVIEW_ROWS)}), columns {column_count}.",
+                    value=data.head(AppConstants.PREVIEW_ROWS).collect(),
                     visible=True,
                 ),
                 gr.update(value=None, visible=False),
             )
 
         @dataframe_data_preview.select(
-            inputs=[dataframe_data_preview],
+            inputs=[session_pl_dataframe],
             outputs=[json_selected_row],
             api_name=False,
         )
         def dataframe_data_preview_selected(
-            data: pl.DataFrame, selected_event: gr.SelectData
+            dataset: tuple[pl.LazyFrame, int, int] | None,
+            selected_event: gr.SelectData,
         ):
-            if selected_event is None or not selected_event.selected:
+            if dataset is None or selected_event is None or not selected_event.selected:
                 return gr.update(value=None, visible=False)
-            # FIXME: This selection will throw an error such as the following error if null values exist.
-            # polars.exceptions.ComputeError: could not append value: "" of type: str to the builder; make sure that all rows have the same schema or consider increasing `infer_schema_length`
-            # it might also be that a value overflows the data-type's capacity
+            data, _, _ = dataset
             return gr.update(
-                value=data.row(index=selected_event.index[0], named=True),
+                value=data.slice(selected_event.index[0], 1).collect().write_ndjson(),
                 visible=True,
             )
 
@@ -375,6 +642,12 @@ class GradioApp:
         self,
         profile_object_in_session: gr.State,
     ) -> gr.Group:
+        @functools.lru_cache(maxsize=8)
+        def decode_profile_image(image_data: str) -> PIL.Image.Image:
+            image = PIL.Image.open(io.BytesIO(base64.b64decode(image_data)))
+            image.load()
+            return image
+
         with gr.Group() as component:
             with gr.Tab(label="View (decorative)") as tab_view_decorative:
                 with gr.Row(equal_height=True):
@@ -458,13 +731,6 @@ class GradioApp:
             )
             def tab_edit_selected(profile: EntityProfile) -> EntityProfile:
                 if profile:
-                    image_bytes = (
-                        base64.b64decode(
-                            profile.representative_image.data.encode("ascii")
-                        )
-                        if profile.representative_image
-                        else None
-                    )
                     return [
                         profile.name.namespace,
                         (
@@ -479,8 +745,8 @@ class GradioApp:
                         gr.update(
                             visible=True if profile.representative_image else False,
                             value=(
-                                PIL.Image.open(io.BytesIO(image_bytes))
-                                if image_bytes
+                                decode_profile_image(profile.representative_image.data)
+                                if profile.representative_image
                                 else None
                             ),
                         ),
@@ -513,8 +779,8 @@ class GradioApp:
                 outputs=[json_view],
                 api_name=False,
             )
-            def tab_json_view_selected(profile: EntityProfile) -> EntityProfile:
-                return profile.model_dump() if profile else None
+            def tab_json_view_selected(profile: EntityProfile) -> str | None:
+                return profile.model_dump_json() if profile else None
 
             @tab_view_decorative.select(
                 inputs=[profile_object_in_session],
@@ -523,12 +789,11 @@ class GradioApp:
             def tab_view_decorative_selected(profile: EntityProfile):
                 if profile:
                     if profile.representative_image:
-                        image_bytes = base64.b64decode(
-                            profile.representative_image.data.encode("ascii")
-                        )
                         return [
                             gr.update(
-                                value=PIL.Image.open(io.BytesIO(image_bytes)),
+                                value=decode_profile_image(
+                                    profile.representative_image.data
+                                ),
                                 visible=True,
                             ),
                             (
@@ -581,7 +846,7 @@ class GradioApp:
                     if image_data:
                         profile_object_in_session_value.representative_image = (
                             ProfileImage(
-                                data=base64.b64encode(image_data).decode("ascii"),
+                                data=GradioApp.encode_profile_image(image_data),
                                 caption=caption,
                                 credits=credits,
                             )
@@ -614,7 +879,9 @@ class GradioApp:
                 return gr.update(
                     visible=True if image_data else False,
                     value=(
-                        PIL.Image.open(io.BytesIO(image_data)) if image_data else None
+                        GradioApp.open_uploaded_image(image_data)
+                        if image_data
+                        else None
                     ),
                 )
 
@@ -661,56 +928,17 @@ class GradioApp:
             fill_height=True,
             fill_width=True,
             analytics_enabled=False,
-            theme=gr.themes.Ocean(
-                radius_size="md",
-                font=gr.themes.GoogleFont("Lato", weights=(100, 300)),
-                font_mono=gr.themes.GoogleFont("IBM Plex Mono", weights=(100, 300)),
-            ),
+            theme=GradioApp.THEME,
         ) as self.interface:
-            gr.Markdown(
-                f"""
-                # gradio-experiments
-
-                A collection of feature experiments with Gradio.
-
-                 - Gradio version: _{gr.get_package_version()}_
-                 - Python version: _{sys.version}_
-                 - Platform: _{platform.uname()._asdict()}_
-                 - GitHub repository: _[gradio-experiments](https://github.com/anirbanbasu/gradio-experiments)_
-                """
-            )
+            gr.Markdown(GradioApp.HEADER_MD)
             with gr.Tab(label="State management"):
                 with gr.Accordion(label="Explanation", open=True):
-                    gr.Markdown(
-                        f"""
-                        This component demonstrates the management of global state, session state (using `gr.State`) and browser state (using `gr.BrowserState`).
-
-                        ## Expected behaviour
-
-                        - **Global state**: The global state is shared across all web sessions. Modifications to the global state are reflected in all sessions.
-                        - **Session state**: The session state is specific to the user's browser session. The session state is not shared across different browser sessions and lost when the browser window is closed or the page is refreshed.
-                        - **Browser state**: The browser state is stored in the browser's local storage. It is not shared across different browsers but shared across multiple windows of the same browser. The browser state persists even when the browser window is closed or the page is refreshed.
-
-                        **Note**: If you want the browser state to be cleared, you must clear the key named `{self.state_key}` from the browser's local storage.
-
-                        ## Try it out
-                        1. Open this page in two different browsers, not just browser tabs.
-                        2. Change the global state in one browser (by clicking the 'Change global state' button) and see the changes reflected in the other browser (by clicking the 'Refresh states' button).
-                        3. Change the session state in one browser (by clicking the 'Change session state' button) and see that the changes are **not** reflected in the other browser (by clicking the 'Refresh states' button). It **will be lost** if the browser window is closed or the page is refreshed.
-                        4. Change the browser state in one browser (by clicking the 'Change browser state' button) and see that the changes are **not** reflected in the other browser (by clicking the 'Refresh states' button). Close one browser and re-open it, click the 'Refresh states' button to see that the browser state has been persisted.
-
-                        Notice that the 'Task output' is the result of a task performed by an object, which is maintained as a reference in the global and session and browser states. Thus, the task output is shared across all sessions even whether it is triggered by a global state change or a session state change or a browser state change.
-                        """
-                    )
+                    gr.Markdown(self.state_management_explanation_md)
                 self.component_state_management()
 
             with gr.Tab(label="Dataset"):
                 with gr.Accordion(label="Explanation", open=True):
-                    gr.Markdown(
-                        """
-                        This component experiments with datasets. _More explanation will be added._
-                        """
-                    )
+                    gr.Markdown(GradioApp.DATASETS_EXPLANATION_MD)
                 self.component_datasets()
 
             with gr.Tab(label="Pydantic entity profiles") as tab_pydantic_profiles:
@@ -720,11 +948,7 @@ class GradioApp:
                     secret=EnvironmentVariables.LOCAL_STORAGE_ENCRYPTION_KEY,
                 )
                 with gr.Accordion(label="Explanation", open=True):
-                    gr.Markdown(
-                        """
-                        This component experiments with profile information backed by Pydantic models. _More explanation will be added._
-                        """
-                    )
+                    gr.Markdown(GradioApp.PYDANTIC_PROFILES_EXPLANATION_MD)
                 self.component_pydantic_profiles(profile_object_in_session)
 
             @tab_pydantic_profiles.select(
@@ -732,10 +956,8 @@ class GradioApp:
                     profile_object_in_session,
                     profile_object_in_browser_storage,
                 ],
-                outputs=[
-                    profile_object_in_session,
-                    profile_object_in_browser_storage,
-                ],
+                # The browser storage is written only by profile_object_in_session_changed
+                outputs=[profile_object_in_session],
                 api_name=False,
             )
             def tab_pydantic_profiles_selected(
@@ -753,10 +975,7 @@ class GradioApp:
                     gr.Info(
                         message=f"Using randomly generated profile '{profile.name.namespace.upper()}, {' '.join(profile.name.other_names)}' since none found in browser storage.",
                     )
-                return (
-                    profile,
-                    gr.update(value=profile) if profile else None,
-                )
+                return profile
 
             @profile_object_in_session.change(
                 inputs=[profile_object_in_session],
@@ -770,31 +989,7 @@ class GradioApp:
 
             with gr.Tab(label="JSON formatting"):
                 with gr.Accordion(label="Explanation", open=True):
-                    gr.Markdown(
-                        """
-                        This component experiments with JSON formatting.
-
-                        As of version 5.38.0, Gradio's JSON component is unable to correctly display a pretty-printed JSON string. Instead of displaying
-                        the JSON string as a formatted dictionary or list, it displays it as a single line of text. For example, a JSON string will be displayed
-                        as follows:
-                        ```json
-                        "{ "text": "Hello", "number": 221, "my_object": { "name": "Sherlock", "time": 1752809241.129743 } }"
-                        ```
-                        instead of:
-                        ```json
-                        {
-                            "text": "Hello",
-                            "number": 221,
-                            "my_object": {
-                                "name": "Sherlock",
-                                "time": 1752809241.129743
-                            }
-                        }
-                        ```
-
-                        The [pull request 11608](https://github.com/gradio-app/gradio/pull/11608) accepted in Gradio version 5.38.1 fixes this issue.
-                        """
-                    )
+                    gr.Markdown(GradioApp.JSON_FORMATTING_EXPLANATION_MD)
                 self.component_json_formatting()
 
             with gr.Tab(label="Text transformations"):
@@ -827,8 +1022,13 @@ def main():
     signal.signal(signal.SIGINT, sigint_handler)
 
     p = subprocess.Popen(["gradio", "environment"])
-    app.construct_ui().queue().launch(
-        server_name="0.0.0.0", share=False, ssr_mode=False, show_api=False
+    app.construct_ui().queue(default_concurrency_limit=8, max_size=64).launch(
+        server_name="0.0.0.0",
+        share=False,
+        ssr_mode=False,
+        show_api=False,
+        # Compress the larger HTTP responses
+        app_kwargs={"middleware": [Middleware(GZipMiddleware, minimum_size=1024)]},
     )
     p.terminate()
 
@@ -1,21 +1,41 @@
-import copy
 import datetime
-import json
+import functools
 import random
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 try:
-    from gradio_experiments.utils import Constants, ic  # noqa: F401
+    from gradio_experiments.utils import Constants
 except ImportError:
     # Fallback import for runs where the current project is not installed in the venv
-    from utils import Constants, ic  # noqa: F401
+    from utils import Constants
 
 import randomname as rn
 
 
+@functools.cache
+def name_words() -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Load the adjectives and the nouns used by `randomname` once, to draw random names from.
+
+    Returns:
+        tuple[tuple[str, ...], tuple[str, ...]]: The title-cased adjectives and nouns.
+    """
+    return (
+        tuple(
+            word.title()
+            for word in rn.util.get_groups_list(rn.util.prefix("a", rn.ADJECTIVES))
+        ),
+        tuple(
+            word.title()
+            for word in rn.util.get_groups_list(rn.util.prefix("n", rn.NOUNS))
+        ),
+    )
+
+
 class SomePydanticNestedModel(BaseModel):
     """An example Pydantic model used in some other Pydantic model for nesting."""
 
@@ -64,11 +84,25 @@ class PydanticEncapsulator:
 
 
 class SomePydanticModel(BaseModel):
-    """An example Pydantic model."""
+    """An example Pydantic model. Instances are never modified once created, so they are frozen."""
+
+    model_config = ConfigDict(frozen=True)
 
     a: int = Field(..., description="An integer field.")
     b: str = Field(..., description="A string field.")
-    c: Optional[List[int]] = Field(default=[], description="A list of integers.")
+    c: Optional[Sequence[int]] = Field(
+        default=(), description="A sequence of integers."
+    )
+
+    @functools.cached_property
+    def dumped(self) -> dict:
+        """
+        The dictionary representation of this model, computed once on first access.
+
+        Returns:
+            dict: The output of `model_dump`, which must not be modified by the caller.
+        """
+        return self.model_dump()
 
 
 class SomeTask:
@@ -78,14 +112,39 @@ class SomeTask:
         """Create a new instance of the SomeTask class without performing the task."""
         self.task_output = "task-not-executed-in-this-session"
 
-    def do_task(self):
-        """Perform the task."""
-        self.task_output = f"task-done at {datetime.datetime.now()}"
+    def do_task(self, now: datetime.datetime | None = None):
+        """
+        Perform the task.
+
+        Args:
+            now (datetime.datetime): The time at which the task is done. Defaults to None, which means the current time.
+        """
+        self.task_output = f"task-done at {now or datetime.datetime.now()}"
 
 
 class StateData:
     """A class to hold the state data for the application."""
 
+    __slots__ = (
+        "a_list",
+        "a_dict",
+        "a_pydantic_object",
+        "an_object",
+        "_version",
+        "_dict_cache",
+        "_dict_cache_version",
+        "_json_cache",
+        "_json_cache_version",
+        "_str_cache",
+        "_str_cache_version",
+    )
+
+    INTEGER_SEQUENCES = tuple(tuple(range(k)) for k in range(10))
+    """Immutable integer sequences `(0, ..., k - 1)`, prebuilt for the random changes."""
+
+    MAX_ITEMS = 128
+    """The maximum number of items kept in each of `a_list` and `a_dict`, the oldest ones are dropped first."""
+
     def __init__(self, an_object: SomeTask | None = None):
         """
         Create a new instance of the StateData class.
@@ -100,6 +159,23 @@ class StateData:
             a=1, b="default", c=[1, 2, 3, 4]
         )
         self.an_object: SomeTask | None = SomeTask() if an_object is None else an_object
+        self._version = 0
+        self._dict_cache: dict | None = None
+        self._dict_cache_version = 0
+        self._json_cache: str | None = None
+        self._json_cache_version = 0
+        self._str_cache: str | None = None
+        self._str_cache_version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        A counter that is incremented every time the object data is changed.
+
+        Returns:
+            int: The current version of the object data.
+        """
+        return self._version
 
     def __hash__(self) -> int:
         """
@@ -113,13 +189,17 @@ class StateData:
 
     def __str__(self) -> str:
         """
-        Nicely formatted JSON string of the dictionary representation of this class.
+        Compact JSON string of the dictionary representation of this class.
+        The string is cached until the object data is changed.
 
         Returns:
             str: A JSON string representation of the object.
         """
         # This is necessary to make an object of the class JSON serializable for gr.BrowserState, see: https://www.gradio.app/guides/state-in-blocks
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=4)
+        if self._str_cache is None or self._str_cache_version != self._version:
+            self._str_cache = orjson.dumps(self.to_dict()).decode()
+            self._str_cache_version = self._version
+        return self._str_cache
 
     def make_random_changes(self, caller: str = "unknown"):
         """
@@ -129,26 +209,37 @@ class StateData:
             caller (str): The name of the caller. Defaults to "unknown".
         """
         now = datetime.datetime.now()
+        # 32-bit fields keep the modulo bias negligible
+        random_bits = random.getrandbits(7 * 32)
+        draws = [(random_bits >> shift) & 0xFFFFFFFF for shift in range(0, 7 * 32, 32)]
+        # The generated values are always valid, so model_construct skips validation
         self.a_list.append(
-            SomePydanticModel(
-                a=random.randint(0, 99),
+            SomePydanticModel.model_construct(
+                a=draws[0] % 100,
                 b=f"changed-{caller}@{now}",
-                c=[i for i in range(random.randint(0, 9))],
+                c=StateData.INTEGER_SEQUENCES[draws[1] % 10],
             )
         )
-        random_key = f"key-{random.randint(0, 9999)}"
-        self.a_dict[random_key] = SomePydanticModel(
-            a=random.randint(0, 999),
+        random_key = f"key-{draws[2] % 10000}"
+        # Move a reassigned key to the end
+        self.a_dict.pop(random_key, None)
+        self.a_dict[random_key] = SomePydanticModel.model_construct(
+            a=draws[3] % 1000,
             b=f"changed-{caller}@{now}",
-            c=[i for i in range(random.randint(0, 9))],
+            c=StateData.INTEGER_SEQUENCES[draws[4] % 10],
         )
-        self.a_pydantic_object = SomePydanticModel(
-            a=random.randint(0, 499),
+        # Drop the oldest items
+        del self.a_list[: -StateData.MAX_ITEMS]
+        while len(self.a_dict) > StateData.MAX_ITEMS:
+            del self.a_dict[next(iter(self.a_dict))]
+        self.a_pydantic_object = SomePydanticModel.model_construct(
+            a=draws[5] % 500,
             b=f"changed-{caller}@{now}",
-            c=[i for i in range(random.randint(0, 9))],
+            c=StateData.INTEGER_SEQUENCES[draws[6] % 10],
         )
         if self.an_object:
-            self.an_object.do_task()
+            self.an_object.do_task(now)
+        self._version += 1
 
     def reset_from_json(self, json_data: dict):
         """
@@ -178,6 +269,7 @@ class StateData:
                 if json_data["a_dict"]
                 else {}
             )
+        self._version += 1
 
     def reset_from_json_str(self, json_str: str):
         """
@@ -186,29 +278,48 @@ class StateData:
         Args:
             json_str (str): The JSON string to reset the object from.
         """
-        self.reset_from_json(json.loads(json_str))
+        self.reset_from_json(orjson.loads(json_str))
 
     def to_dict(self):
         """
-        Converts the object into a dictionary representation.
+        Converts the object into a dictionary representation. The dictionary is cached until the
+        object data is changed, so it must not be modified by the caller.
 
         Returns:
             dict: A dictionary representation of the object.
         """
-        return {
-            "a_pydantic_object": (
-                self.a_pydantic_object.model_dump() if self.a_pydantic_object else None
-            ),
-            "an_object": str(self.an_object) if self.an_object else None,
-            "a_list": (
-                [item.model_dump() for item in self.a_list] if self.a_list else None
-            ),
-            "a_dict": (
-                {k: v.model_dump() for k, v in self.a_dict.items()}
-                if self.a_dict
-                else None
-            ),
-        }
+        if self._dict_cache is None or self._dict_cache_version != self._version:
+            self._dict_cache = {
+                "a_pydantic_object": (
+                    self.a_pydantic_object.dumped if self.a_pydantic_object else None
+                ),
+                "an_object": str(self.an_object) if self.an_object else None,
+                "a_list": (
+                    [item.dumped for item in self.a_list] if self.a_list else None
+                ),
+                "a_dict": (
+                    {k: v.dumped for k, v in self.a_dict.items()}
+                    if self.a_dict
+                    else None
+                ),
+            }
+            self._dict_cache_version = self._version
+        return self._dict_cache
+
+    def to_json(self) -> str:
+        """
+        Indented JSON string of the dictionary representation of this class, used for display.
+        The string is cached until the object data is changed.
+
+        Returns:
+            str: A JSON string representation of the object.
+        """
+        if self._json_cache is None or self._json_cache_version != self._version:
+            self._json_cache = orjson.dumps(
+                self.to_dict(), option=orjson.OPT_INDENT_2
+            ).decode()
+            self._json_cache_version = self._version
+        return self._json_cache
 
     def __deepcopy__(self, memo):
         """
@@ -222,11 +333,20 @@ class StateData:
         """
         cls = self.__class__
         newone = cls.__new__(cls)
-        newone.a_pydantic_object = copy.deepcopy(self.a_pydantic_object, memo=memo)
-        newone.a_list = copy.deepcopy(self.a_list, memo=memo)
-        newone.a_dict = copy.deepcopy(self.a_dict, memo=memo)
+        memo[id(self)] = newone
+        # The frozen models are shared, only the containers are copied
+        newone.a_pydantic_object = self.a_pydantic_object
+        newone.a_list = list(self.a_list)
+        newone.a_dict = dict(self.a_dict)
         # Notice that newone.an_object is not created again and is shared between the original and the new object.
         newone.an_object = self.an_object
+        newone._version = self._version
+        newone._dict_cache = self._dict_cache
+        newone._dict_cache_version = self._dict_cache_version
+        newone._json_cache = self._json_cache
+        newone._json_cache_version = self._json_cache_version
+        newone._str_cache = self._str_cache
+        newone._str_cache_version = self._str_cache_version
         return newone
 
 
@@ -268,7 +388,7 @@ class EntityProfile(BaseModel):
     entity_id: Optional[str] = Field(
         title="Entity ID",
         description="The unique identifier of the entity.",
-        default=uuid4().hex,
+        default_factory=lambda: uuid4().hex,
     )
     name: Optional[ProfileName] = Field(
         default=None, title="Name", description="The name of the entity."
@@ -285,16 +405,13 @@ class EntityProfile(BaseModel):
     @staticmethod
     def create_random_profile():
         # Get two random names
-        n1_1, n1_2 = rn.get_name(sep=Constants.SPACE_STRING).split(
-            Constants.SPACE_STRING
-        )
-        n2_1, n2_2 = rn.get_name(sep=Constants.SPACE_STRING).split(
-            Constants.SPACE_STRING
-        )
-        retval = EntityProfile(
-            name=ProfileName(
-                namespace=n1_1.title(),
-                other_names=[n1_2.title(), n2_1.title(), n2_2.title()],
+        adjectives, nouns = name_words()
+        n1_1, n2_1 = random.choices(adjectives, k=2)
+        n1_2, n2_2 = random.choices(nouns, k=2)
+        retval = EntityProfile.model_construct(
+            name=ProfileName.model_construct(
+                namespace=n1_1,
+                other_names=[n1_2, n2_1, n2_2],
             ),
         )
         return retval
@@ -5,7 +5,10 @@ from environs import Env
 try:
     from icecream import ic
 except ImportError:  # Graceful fallback if IceCream isn't installed.
-    ic = lambda *a: None if not a else (a[0] if len(a) == 1 else a)  # noqa
+
+    def ic(*a):
+        """A no-op replacement for IceCream's `ic`, which returns its arguments like `ic` does."""
+        return a[0] if len(a) == 1 else (a or None)
 
 
 env = Env()
@@ -40,6 +43,7 @@ class AppConstants(Constants):
         FILE_EXTENSION_JSON,
         FILE_EXTENSION_PARQUET,
     ]
+    PREVIEW_ROWS = 200
 
 
 class EnvironmentVariables:
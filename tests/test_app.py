@@ -0,0 +1,25 @@
+import base64
+import io
+
+import PIL.Image
+
+try:
+    from gradio_experiments.app import GradioApp  # noqa: F401
+except ImportError:
+    from app import GradioApp  # noqa: F401
+
+
+class TestGradioApp:
+    """Tests for the helpers of the Gradio application."""
+
+    def test_encode_profile_image_exif_orientation(self):
+        # A landscape JPEG which is shown as portrait because of its EXIF orientation.
+        exif = PIL.Image.Exif()
+        exif[0x0112] = 6
+        buffer = io.BytesIO()
+        PIL.Image.new("RGB", (1024, 512), "red").save(buffer, format="JPEG", exif=exif)
+        encoded = GradioApp.encode_profile_image(buffer.getvalue())
+        image = PIL.Image.open(io.BytesIO(base64.b64decode(encoded)))
+        assert image.format == "WEBP"
+        assert image.size == (256, 512)
+        assert image.getexif().get(0x0112, 1) == 1
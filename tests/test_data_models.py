@@ -1,7 +1,9 @@
+import copy
+
 try:
-    from gradio_experiments.data import StateData  # noqa: F401
+    from gradio_experiments.data import EntityProfile, StateData  # noqa: F401
 except ImportError:
-    from data import StateData  # noqa: F401
+    from data import EntityProfile, StateData  # noqa: F401
 
 
 class TestDataModels:
@@ -13,3 +15,77 @@ class TestDataModels:
         assert state_data.a_pydantic_object.a == 1
         assert state_data.a_pydantic_object.b == "default"
         assert state_data.a_pydantic_object.c == [1, 2, 3, 4]
+
+    def test_state_data_deepcopy(self):
+        state_data = StateData()
+        state_data.make_random_changes("test")
+        container = [state_data, state_data]
+        copied = copy.deepcopy(container)
+        assert copied[0] is copied[1]
+        assert copied[0] is not state_data
+        assert copied[0].an_object is state_data.an_object
+        assert copied[0].a_list == state_data.a_list
+        assert copied[0].a_list is not state_data.a_list
+        copied[0].make_random_changes("copy")
+        assert len(copied[0].a_list) == 2
+        assert len(state_data.a_list) == 1
+
+    def test_state_data_to_dict_reuses_model_dumps(self):
+        state_data = StateData()
+        state_data.make_random_changes("test")
+        first = state_data.to_dict()
+        second = state_data.to_dict()
+        assert first == second
+        assert first["a_list"][0] is second["a_list"][0]
+        assert first["a_list"][0] == state_data.a_list[0].model_dump()
+
+    def test_state_data_version(self):
+        state_data = StateData()
+        assert state_data.version == 0
+        state_data.make_random_changes("test")
+        assert state_data.version == 1
+        assert copy.deepcopy(state_data).version == 1
+        restored = StateData()
+        restored.reset_from_json_str(str(state_data))
+        assert restored.version == 1
+
+    def test_state_data_to_dict_cache(self):
+        state_data = StateData()
+        first = state_data.to_dict()
+        assert state_data.to_dict() is first
+        state_data.make_random_changes("test")
+        changed = state_data.to_dict()
+        assert changed is not first
+        assert len(changed["a_list"]) == 1
+
+    def test_state_data_to_json_cache(self):
+        state_data = StateData()
+        first = state_data.to_json()
+        assert state_data.to_json() is first
+        state_data.make_random_changes("test")
+        assert state_data.to_json() != first
+
+    def test_state_data_str_cache(self):
+        state_data = StateData()
+        first = str(state_data)
+        assert str(state_data) is first
+        state_data.make_random_changes("test")
+        assert str(state_data) != first
+
+    def test_state_data_slots(self):
+        state_data = StateData()
+        assert not hasattr(state_data, "__dict__")
+
+    def test_state_data_bounded(self):
+        state_data = StateData()
+        for _ in range(StateData.MAX_ITEMS + 10):
+            state_data.make_random_changes("test")
+        assert len(state_data.a_list) == StateData.MAX_ITEMS
+        assert len(state_data.a_dict) <= StateData.MAX_ITEMS
+        assert state_data.a_list[-1].b.startswith("changed-test@")
+
+    def test_random_profile_ids(self):
+        first = EntityProfile.create_random_profile()
+        second = EntityProfile.create_random_profile()
+        assert first.entity_id != second.entity_id
+        assert EntityProfile.model_validate(first.model_dump()) == first